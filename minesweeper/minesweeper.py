@@ -1,7 +1,29 @@
+import collections
 import itertools
 import random
 
 
+def _count_all_neighbors(board, height, width):
+    """
+    Computes the nearby-mine count of every cell in one batch pass.
+
+    Kept as a module-level function over a flat buffer so the whole
+    kernel could be JIT-compiled as-is should boards ever grow large
+    enough to need it.
+    """
+    counts = [0] * (height * width)
+    for i in range(height):
+        for j in range(width):
+            if not board[i * width + j]:
+                continue
+            # bump the full clamped 3x3 window, then undo the mine's own cell
+            for ni in range(max(i - 1, 0), min(i + 2, height)):
+                for nj in range(max(j - 1, 0), min(j + 2, width)):
+                    counts[ni * width + nj] += 1
+            counts[i * width + j] -= 1
+    return counts
+
+
 class Minesweeper():
     """
     Minesweeper game representation
@@ -14,21 +36,17 @@ class Minesweeper():
         self.width = width
         self.mines = set()
 
-        # Initialize an empty field with no mines
-        self.board = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                row.append(False)
-            self.board.append(row)
+        # Initialize an empty field with no mines, stored as one flat
+        # byte per cell rather than a list of per-row lists
+        self.board = bytearray(height * width)
+
+        # Add mines randomly, sampling distinct positions in one shot
+        for position in random.sample(range(height * width), mines):
+            self.mines.add(divmod(position, width))
+            self.board[position] = 1
 
-        # Add mines randomly
-        while len(self.mines) != mines:
-            i = random.randrange(height)
-            j = random.randrange(width)
-            if not self.board[i][j]:
-                self.mines.add((i, j))
-                self.board[i][j] = True
+        # Lazily computed grid of nearby-mine counts
+        self._counts = None
 
         # At first, player has found no mines
         self.mines_found = set()
@@ -41,7 +59,7 @@ class Minesweeper():
         for i in range(self.height):
             print("--" * self.width + "-")
             for j in range(self.width):
-                if self.board[i][j]:
+                if self.board[i * self.width + j]:
                     print("|X", end="")
                 else:
                     print("| ", end="")
@@ -50,7 +68,7 @@ class Minesweeper():
 
     def is_mine(self, cell):
         i, j = cell
-        return self.board[i][j]
+        return bool(self.board[i * self.width + j])
 
     def nearby_mines(self, cell):
         """
@@ -58,24 +76,17 @@ class Minesweeper():
         within one row and column of a given cell,
         not including the cell itself.
         """
+        if self._counts is None:
+            self._compute_counts()
+        i, j = cell
+        return self._counts[i * self.width + j]
 
-        # Keep count of nearby mines
-        count = 0
-
-        # Loop over all cells within one row and column
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-
-                # Ignore the cell itself
-                if (i, j) == cell:
-                    continue
-
-                # Update count if cell in bounds and is mine
-                if 0 <= i < self.height and 0 <= j < self.width:
-                    if self.board[i][j]:
-                        count += 1
-
-        return count
+    def _compute_counts(self):
+        """
+        Precomputes the nearby-mine count of every cell in a single
+        pass over the board, so each nearby_mines call is one lookup.
+        """
+        self._counts = _count_all_neighbors(self.board, self.height, self.width)
 
     def won(self):
         """
@@ -90,17 +101,23 @@ class Sentence():
     A sentence consists of a set of board cells,
     and a count of the number of those cells which are mines.
     """
-    safes = set()
-    mines = set()
 
     def __init__(self, cells, count):
         self.cells = set(cells)
         self.count = count
         # Keep track of cells known to be safe or mines
+        self.safes = set()
+        self.mines = set()
+        # Immutable key frozen at construction, so the hash stays stable
+        # while cells are reduced away
+        self._key = (frozenset(self.cells), count)
 
     def __eq__(self, other):
         return self.cells == other.cells and self.count == other.count
 
+    def __hash__(self):
+        return hash(self._key)
+
     def __str__(self):
         return f"{self.cells} = {self.count}"
 
@@ -129,46 +146,43 @@ class Sentence():
         self.mines.add(cell)
 
     def reduce_sentence(self, other):
-        if self.is_empty() or other.is_empty() == set() or self is other:
-            return False  
-               
-        if self.cells.issubset(other.cells):
-            # in order to change
-            tempSen = Sentence(other.cells.difference(self.cells), other.count - self.count)
-            other.cells = self.cells
-            other.count = self.count
-            self.cells = tempSen.cells
-            self.count = tempSen.count
+        if self is other or not self.cells or not other.cells:
+            return False
+
+        # one intersection pass; both subset tests fall out of its size,
+        # and disjoint pairs (common once knowledge spans the board)
+        # bail out before any further set work
+        intersection = self.cells & other.cells
+        if not intersection:
+            return False
+
+        if len(intersection) == len(self.cells):
+            # self is a subset of other; keep the remainder in self
+            other.cells, self.cells = self.cells, other.cells - self.cells
+            other.count, self.count = self.count, other.count - self.count
             self.mark_if_deterministic()
             return True
 
-        if other.cells.issubset(self.cells):
-            self.cells.difference_update(other.cells)
+        if len(intersection) == len(other.cells):
+            self.cells -= other.cells
             self.count -= other.count
             self.mark_if_deterministic()
             return True
-        
-        largeSen = Sentence([], 0)
-        smallSen = Sentence([], 0)
+
+        # partial overlap: if the larger count already accounts for every
+        # cell outside the intersection, the smaller sentence's remaining
+        # cells must all be safe
         if self.count > other.count:
-            largeSen.cells = self.cells
-            largeSen.count = self.count
-            smallSen.cells = other.cells
-            smallSen.count = other.count
+            largeSen, smallSen = self, other
         else:
-            largeSen.cells = other.cells
-            largeSen.count = other.count
-            smallSen.cells = self.cells
-            smallSen.count = self.count
+            largeSen, smallSen = other, self
 
-        intersection = largeSen.cells.intersection(smallSen.cells)
-        cellsInLargeNotInBoth = largeSen.cells.difference(intersection)
-
-        if largeSen.count - len(cellsInLargeNotInBoth) == smallSen.count:
-            for cell in smallSen.cells.difference(intersection):
+        outsideLarge = len(largeSen.cells) - len(intersection)
+        if largeSen.count - outsideLarge == smallSen.count:
+            for cell in smallSen.cells - intersection:
                 smallSen.mark_safe(cell)
             return True
-         
+
         return False
 
     def mark_safe(self, cell):
@@ -216,26 +230,62 @@ class MinesweeperAI():
         self.mines = set()
         self.safes = set()
 
+        # Safe cells that have not been played yet
+        self._pending_safes = set()
+
+        # Cells that are neither played nor known mines
+        self._unexplored = {
+            (i, j) for i in range(height) for j in range(width)
+        }
+
         # List of sentences about the game known to be true
         self.knowledge = []
 
+        # Worklist of sentences that changed and need re-examination
+        self._dirty = collections.deque()
+
+        # Newly discovered safes/mines waiting to be applied to the
+        # knowledge base in one bulk pass per sentence
+        self._pending_new_safes = set()
+        self._pending_new_mines = set()
+
+        # Keys of sentences already added, to skip duplicates
+        self._known_keys = set()
+
+        # Inverted index from cell to the sentences mentioning it, so
+        # reductions only visit sentences that can actually interact
+        self._cell_index = {}
+
+        # Precomputed neighbor sets, since the board size never changes
+        self._neighbors = {
+            (i, j): frozenset(self._build_nearby_cells((i, j)))
+            for i in range(height) for j in range(width)
+        }
+
     def mark_mine(self, cell):
         """
         Marks a cell as a mine, and updates all knowledge
         to mark that cell as a mine as well.
         """
+        # already broadcast to every sentence the first time around
+        if cell in self.mines:
+            return
         self.mines.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_mine(cell)
+        self._unexplored.discard(cell)
+        self._pending_new_mines.add(cell)
 
     def mark_safe(self, cell):
         """
         Marks a cell as safe, and updates all knowledge
         to mark that cell as safe as well.
         """
+        # already broadcast to every sentence the first time around
+        if cell in self.safes:
+            return
         self.safes.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_safe(cell)       
+        if cell not in self.moves_made:
+            self._pending_safes.add(cell)
+        self._pending_new_safes.add(cell)
 
     def add_knowledge(self, cell, count):
         """
@@ -254,6 +304,8 @@ class MinesweeperAI():
         """
         # mark the cell as a move that has been made
         self.moves_made.add(cell)
+        self._pending_safes.discard(cell)
+        self._unexplored.discard(cell)
         # mark the cell as safe
         self.mark_safe(cell)
         # create a new sentence based on the value of `cell` and `count`
@@ -264,46 +316,112 @@ class MinesweeperAI():
         if newKnowledge.mark_if_deterministic():
             self.update_knowledge_marks_from(newKnowledge)
         # add the new sentence if not already exhausted its value
+        # and not a duplicate of one seen before
         if not newKnowledge.is_empty():
-            self.knowledge.append(newKnowledge)
+            key = (frozenset(newKnowledge.cells), newKnowledge.count)
+            if key not in self._known_keys:
+                self._known_keys.add(key)
+                self.knowledge.append(newKnowledge)
+                self._register_sentence(newKnowledge)
+                self._dirty.append(newKnowledge)
         self.conclude_new_information()
 
     def conclude_new_information(self):
-        beforeSafes = set(self.safes)
-        beforeMines = set(self.mines)
-        for i in range(len(self.knowledge)):
-            for j in range(i, len(self.knowledge)):
-                self.update_knowledge_marks_from(self.knowledge[i])
-                self.update_marks_to(self.knowledge[i])
-                if i == j:
-                    continue
-                self.knowledge[i].reduce_sentence(self.knowledge[j])
-                self.update_knowledge_marks_from(self.knowledge[i])      
-        for sen in list(self.knowledge):
+        """
+        Drains the worklist of changed sentences, reducing each one only
+        against sentences it shares cells with and re-queueing whatever
+        changed, until no new conclusions arrive.
+        """
+        while self._dirty or self._pending_new_safes or self._pending_new_mines:
+            self._flush_pending_marks()
+            if not self._dirty:
+                break
+            sentence = self._dirty.popleft()
+            # sentences with no cells left have nothing to conclude
+            if not sentence.cells:
+                continue
+            sentence.mark_if_deterministic()
+            self.update_knowledge_marks_from(sentence)
+            changed = False
+            for other in self._sentences_sharing_cells(sentence):
+                if sentence.reduce_sentence(other):
+                    changed = True
+                    # a reduction may hand cells between sentences
+                    self._register_sentence(sentence)
+                    self._register_sentence(other)
+                    self.update_knowledge_marks_from(sentence)
+                    self.update_knowledge_marks_from(other)
+                    if other.cells:
+                        self._dirty.append(other)
+                    if not sentence.cells:
+                        break
+            if changed and sentence.cells:
+                self._dirty.append(sentence)
+        # drop exhausted sentences in one pass instead of remove() scans
+        for sen in self.knowledge:
             if sen.is_empty():
-                self.knowledge.remove(sen)
-        if not (beforeSafes == self.safes and beforeMines == self.mines):
-            self.conclude_new_information()
+                self._unregister_sentence(sen)
+        self.knowledge = [sen for sen in self.knowledge if not sen.is_empty()]
+
+    def _flush_pending_marks(self):
+        """
+        Applies the pending safe/mine discoveries to every sentence that
+        mentions them, one bulk set operation per sentence instead of a
+        broadcast call per cell.
+        """
+        safes, self._pending_new_safes = self._pending_new_safes, set()
+        mines, self._pending_new_mines = self._pending_new_mines, set()
+        affected = set()
+        for cell in safes | mines:
+            affected |= self._cell_index.get(cell, set())
+        for sentence in affected:
+            mineOverlap = sentence.cells & mines
+            if mineOverlap:
+                sentence.cells -= mineOverlap
+                sentence.count -= len(mineOverlap)
+                sentence.mines |= mineOverlap
+            safeOverlap = sentence.cells & safes
+            if safeOverlap:
+                sentence.cells -= safeOverlap
+                sentence.safes |= safeOverlap
+            if mineOverlap or safeOverlap:
+                self._dirty.append(sentence)
+
+    def _sentences_sharing_cells(self, sentence):
+        candidates = set()
+        for cell in sentence.cells:
+            candidates |= self._cell_index.get(cell, set())
+        # stale index entries are fine: reduce_sentence bails out on
+        # disjoint pairs before doing any real work
+        return [other for other in candidates if other is not sentence]
+
+    def _register_sentence(self, sentence):
+        for cell in sentence.cells:
+            self._cell_index.setdefault(cell, set()).add(sentence)
+
+    def _unregister_sentence(self, sentence):
+        for bucket in self._cell_index.values():
+            bucket.discard(sentence)
 
     def update_marks_to(self, newKnoledge):
-        for safeCell in self.safes:
-            newKnoledge.mark_safe(safeCell)
-        for mineCell in self.mines:
-            newKnoledge.mark_mine(mineCell)
-    """         for newCell in set(newKnoledge.cells):
-            if newCell in self.safes:
-                newKnoledge.mark_safe(newCell)
-            if newCell in self.mines:
-                newKnoledge.mark_mine(newCell) """
+        # apply everything already known in bulk set ops rather than
+        # one mark call per known cell
+        safeCells = newKnoledge.cells & self.safes
+        if safeCells:
+            newKnoledge.cells -= safeCells
+            newKnoledge.safes |= safeCells
+        mineCells = newKnoledge.cells & self.mines
+        if mineCells:
+            newKnoledge.cells -= mineCells
+            newKnoledge.count -= len(mineCells)
+            newKnoledge.mines |= mineCells
 
     def update_knowledge_marks_from(self, sentence):
-        for cellToMark in set(sentence.safes):
+        for cellToMark in sentence.safes:
             self.mark_safe(cellToMark)
-        for cellToMark in set(sentence.mines):
+        for cellToMark in sentence.mines:
             self.mark_mine(cellToMark)
-        for sen in self.knowledge:
-            sen.mark_if_deterministic()
-        
+
     def make_safe_move(self):
         """
         Returns a safe cell to choose on the Minesweeper board.
@@ -313,10 +431,7 @@ class MinesweeperAI():
         This function may use the knowledge in self.mines, self.safes
         and self.moves_made, but should not modify any of those values.
         """
-        for cell in self.safes:
-            if cell not in self.moves_made:
-                return cell
-        return None
+        return next(iter(self._pending_safes), None)
 
     def make_random_move(self):
         """
@@ -325,24 +440,28 @@ class MinesweeperAI():
             1) have not already been chosen, and
             2) are not known to be mines
         """
-        for i in range(self.width):
-            for j in range(self.height):
-                if (i, j) not in self.moves_made and (i, j) not in self.mines:
-                    return (i, j)
+        if not self._unexplored:
+            return None
+        return random.choice(list(self._unexplored))
     
     def get_nearby_cells(self, cell):
+        # copy the precomputed frozenset since Sentence mutates its cells
+        return set(self._neighbors[cell])
+
+    def _build_nearby_cells(self, cell):
+        i, j = cell
+        # interior cells always have all eight neighbors, so build them
+        # as one unrolled set literal with no bounds checks
+        if 0 < i < self.height - 1 and 0 < j < self.width - 1:
+            return {
+                (i - 1, j - 1), (i - 1, j), (i - 1, j + 1),
+                (i, j - 1), (i, j + 1),
+                (i + 1, j - 1), (i + 1, j), (i + 1, j + 1),
+            }
+        # boundary cells take the bounds-checked path
         nearbyCells = set()
-        # Loop over all cells within one row and column
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-
-                # Ignore the cell itself
-                if (i, j) == cell:
-                    continue
-                # skip cells outside board game
-                if i == self.height or j == self.width or i < 0 or j < 0:
-                    continue
-                # add neighboring cell to nearby cell set
-                nearbyCells.add((i, j))
-                
+        for ni in range(max(i - 1, 0), min(i + 2, self.height)):
+            for nj in range(max(j - 1, 0), min(j + 2, self.width)):
+                if (ni, nj) != cell:
+                    nearbyCells.add((ni, nj))
         return nearbyCells
\ No newline at end of file
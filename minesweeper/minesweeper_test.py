@@ -20,10 +20,10 @@ class TestMinesweeper(unittest.TestCase):
     def test_nearby_mines(self):
         """Test the nearby_mines method for correctness."""
         # Manually place mines for predictable testing
-        self.minesweeper.board = [[False] * 4 for _ in range(4)]
-        self.minesweeper.board[1][1] = True  # Mine at (1, 1)
-        self.minesweeper.board[2][2] = True  # Mine at (2, 2)
-        self.minesweeper.board[3][3] = True  # Mine at (3, 3)
+        self.minesweeper.board = bytearray(4 * 4)
+        self.minesweeper.board[1 * 4 + 1] = 1  # Mine at (1, 1)
+        self.minesweeper.board[2 * 4 + 2] = 1  # Mine at (2, 2)
+        self.minesweeper.board[3 * 4 + 3] = 1  # Mine at (3, 3)
 
         self.assertEqual(self.minesweeper.nearby_mines((0, 0)), 1)
         self.assertEqual(self.minesweeper.nearby_mines((1, 0)), 1)
@@ -89,9 +89,16 @@ class TestMinesweeperAI(unittest.TestCase):
 
     def test_make_safe_move(self):
         """Test the AI's ability to make a safe move."""
-        self.ai.safes.add((0, 0))
         self.ai.moves_made.add((1, 1))
+        self.ai.mark_safe((0, 0))
+        self.ai.mark_safe((1, 1))
         self.assertEqual(self.ai.make_safe_move(), (0, 0))
 
+    def test_make_safe_move_none_left(self):
+        """Test that make_safe_move returns None once safes are exhausted."""
+        ai = minesweeper.MinesweeperAI(height=1, width=1)
+        ai.add_knowledge((0, 0), 0)
+        self.assertIsNone(ai.make_safe_move())
+
 if __name__ == "__main__":
     unittest.main()